@@ -31,9 +31,7 @@ def main():
         print(f"Prompt version: {prompt.meta.get('version')}")
 
         # Use the prompt with variables
-        message = prompt.content\
-            .replace("{{name}}", "Alice")\
-            .replace("{{product}}", "PLP")
+        message = prompt.render({"name": "Alice", "product": "PLP"})
         print(f"Final message: {message}")
 
         # Clean up
@@ -7,6 +7,7 @@ from .client import (
     PLPError,
     PromptEnvelope,
     PromptInput,
+    PromptRef,
     # Multi-modal types
     TextContent,
     ImageUrl,
@@ -25,13 +26,16 @@ from .client import (
     normalize_content,
     get_text_content,
 )
+from .async_client import AsyncPLPClient
 
 __version__ = "1.1.0"
 __all__ = [
     "PLPClient",
+    "AsyncPLPClient",
     "PLPError",
     "PromptEnvelope",
     "PromptInput",
+    "PromptRef",
     # Multi-modal types
     "TextContent",
     "ImageUrl",
@@ -0,0 +1,360 @@
+"""
+PLP prompt content types and helpers
+
+Kept free of I/O and fully type-annotated so it can be compiled with mypyc
+(see the opt-in ``mypyc`` build hook in pyproject.toml).
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union, cast
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+# Template variables such as {{name}} or {{ name }}
+_VARIABLE_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+# =============================================================================
+# Multi-modal Content Types
+# =============================================================================
+
+
+class TextContent:
+    """Text content part."""
+
+    __slots__ = ("type", "text")
+
+    type: str  # Always "text"
+    text: str
+
+    def __init__(self, text: str) -> None:
+        self.type = "text"
+        self.text = text
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TextContent):
+            return NotImplemented
+        return self.text == other.text
+
+    def __repr__(self) -> str:
+        return f"TextContent(type={self.type!r}, text={self.text!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.type, "text": self.text}
+
+    def to_json_bytes(self) -> bytes:
+        return _dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TextContent":
+        return cls(text=data["text"])
+
+
+class ImageUrl:
+    """Image URL with optional detail level."""
+
+    __slots__ = ("url", "detail")
+
+    url: str
+    detail: Optional[str]  # "auto" | "low" | "high"
+
+    def __init__(self, url: str, detail: Optional[str] = None) -> None:
+        self.url = url
+        self.detail = detail
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ImageUrl):
+            return NotImplemented
+        return self.url == other.url and self.detail == other.detail
+
+    def __repr__(self) -> str:
+        return f"ImageUrl(url={self.url!r}, detail={self.detail!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"url": self.url}
+        if self.detail:
+            result["detail"] = self.detail
+        return result
+
+    def to_json_bytes(self) -> bytes:
+        return _dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ImageUrl":
+        return cls(url=data["url"], detail=data.get("detail"))
+
+
+class ImageContent:
+    """Image content part."""
+
+    __slots__ = ("type", "image_url")
+
+    type: str  # Always "image_url"
+    image_url: ImageUrl
+
+    def __init__(self, image_url: ImageUrl) -> None:
+        self.type = "image_url"
+        self.image_url = image_url
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ImageContent):
+            return NotImplemented
+        return self.image_url == other.image_url
+
+    def __repr__(self) -> str:
+        return f"ImageContent(type={self.type!r}, image_url={self.image_url!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.type, "image_url": self.image_url.to_dict()}
+
+    def to_json_bytes(self) -> bytes:
+        return _dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ImageContent":
+        return cls(image_url=ImageUrl.from_dict(data["image_url"]))
+
+
+# Type aliases
+ContentPart = Union[TextContent, ImageContent]
+PromptContent = Union[str, List[ContentPart]]
+
+
+# Content part constructors keyed by their "type" tag
+_PART_CTORS: Dict[str, Callable[[Dict[str, Any]], ContentPart]] = {
+    "text": TextContent.from_dict,
+    "image_url": ImageContent.from_dict,
+}
+
+
+def content_part_from_dict(data: Dict[str, Any]) -> ContentPart:
+    """Create a ContentPart from a dictionary."""
+    part_type = data["type"]
+    ctor = _PART_CTORS.get(part_type)
+    if ctor is None:
+        raise ValueError(f"Unknown content part type: {part_type}")
+    return ctor(data)
+
+
+def content_from_dict(data: Union[str, List[Dict[str, Any]]]) -> PromptContent:
+    """Create PromptContent from a dictionary or string."""
+    if isinstance(data, str):
+        return data
+    return [content_part_from_dict(part) for part in data]
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def content_to_dict(content: PromptContent) -> Union[str, List[Dict[str, Any]]]:
+    """Convert PromptContent to dictionary or string."""
+    if isinstance(content, str):
+        return content
+    return [part.to_dict() for part in content]
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def is_multi_modal(prompt: Union["PromptEnvelope", PromptContent]) -> bool:
+    """
+    Check if a prompt has multi-modal content (images).
+
+    Args:
+        prompt: The prompt envelope or content
+
+    Returns:
+        True if content contains image parts
+    """
+    if isinstance(prompt, PromptEnvelope):
+        if prompt._content is not None:
+            # Decoded parts may be edited in place, so they are always rescanned
+            return is_multi_modal(prompt._content)
+        # Parts that have not been decoded yet are checked by their type tag
+        # instead of being decoded for this; the raw list is private, so the
+        # answer is memoized until the content is decoded or reassigned.
+        if prompt._is_multi_modal is None:
+            raw_parts = prompt._raw_content or []
+            prompt._is_multi_modal = any(
+                part["type"] == "image_url" for part in raw_parts
+            )
+        return prompt._is_multi_modal
+
+    if isinstance(prompt, str):
+        return False
+
+    return any(type(part) is ImageContent for part in prompt)
+
+
+def normalize_content(content: PromptContent) -> List[ContentPart]:
+    """
+    Normalize content to ContentPart[] format.
+
+    Args:
+        content: String or ContentPart array
+
+    Returns:
+        ContentPart[] (string is wrapped as single TextContent)
+    """
+    if isinstance(content, str):
+        return [TextContent(text=content)]
+    return content
+
+
+def get_text_content(content: PromptContent) -> str:
+    """
+    Get text-only content from a prompt (useful for token counting).
+
+    Args:
+        content: String or ContentPart array
+
+    Returns:
+        Combined text from all text parts
+    """
+    if isinstance(content, str):
+        return content
+
+    # str.join materializes its argument anyway, so a list is cheaper than
+    # a generator here.
+    return "\n".join([part.text for part in content if type(part) is TextContent])
+
+
+# =============================================================================
+# Prompt Types
+# =============================================================================
+
+
+class PromptEnvelope:
+    """Represents a PLP prompt envelope."""
+
+    # Parsed content, or None while multi-modal parts are still in _raw_content
+    _content: Optional[PromptContent]
+    _raw_content: Optional[List[Dict[str, Any]]]
+    # is_multi_modal() result for _raw_content, reset whenever content is
+    # reassigned
+    _is_multi_modal: Optional[bool]
+
+    def __init__(self, id: str, content: PromptContent, meta: Dict[str, Any]) -> None:
+        self.id = id
+        self.content = content
+        self.meta = meta
+
+    @property
+    def content(self) -> PromptContent:
+        """The prompt content; multi-modal parts are decoded on first access."""
+        if self._content is None:
+            # from_dict() only leaves _content unset for a list of raw parts
+            raw_parts = cast(List[Dict[str, Any]], self._raw_content)
+            self._content = content_from_dict(raw_parts)
+        return self._content
+
+    @content.setter
+    def content(self, value: PromptContent) -> None:
+        self._content = value
+        self._raw_content = None
+        self._is_multi_modal = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PromptEnvelope":
+        """Create a PromptEnvelope from a dictionary."""
+        content = data["content"]
+        if isinstance(content, str):
+            return cls(id=data["id"], content=content, meta=data.get("meta", {}))
+        if not isinstance(content, list):
+            raise ValueError(f"Invalid prompt content: {content!r}")
+
+        # Defer building ContentPart objects until content is first read, so
+        # callers that only look at id/meta never pay for it.
+        envelope = cls(id=data["id"], content=[], meta=data.get("meta", {}))
+        envelope._content = None
+        envelope._raw_content = content
+        return envelope
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "content": content_to_dict(self.content),
+            "meta": self.meta,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes; undecoded parts are written from the raw list."""
+        if self._content is None:
+            return _dumps(
+                {"id": self.id, "content": self._raw_content, "meta": self.meta}
+            )
+        return _dumps(self.to_dict())
+
+    def render(self, variables: Mapping[str, Any]) -> PromptContent:
+        """
+        Substitute ``{{name}}`` template variables in the prompt content.
+
+        All variables are replaced in a single pass over the text. For
+        multi-modal content only text parts are rendered; image parts are
+        returned unchanged.
+
+        Args:
+            variables: Values for the template variables
+
+        Returns:
+            The rendered content, in the same shape as ``content``
+
+        Raises:
+            KeyError: If the content uses a variable missing from ``variables``
+        """
+
+        def substitute(match: "re.Match[str]") -> str:
+            return str(variables[match.group(1)])
+
+        if isinstance(self.content, str):
+            return _VARIABLE_RE.sub(substitute, self.content)
+        return [
+            (
+                TextContent(text=_VARIABLE_RE.sub(substitute, part.text))
+                if type(part) is TextContent
+                else part
+            )
+            for part in self.content
+        ]
+
+    def __repr__(self) -> str:
+        return f"PromptEnvelope(id='{self.id}', version={self.meta.get('version', 'latest')})"
+
+
+class PromptInput:
+    """Input for creating/updating a prompt."""
+
+    def __init__(
+        self, content: PromptContent, meta: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.content = content
+        self.meta = meta or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "content": content_to_dict(self.content),
+            "meta": self.meta,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes."""
+        return _dumps(self.to_dict())
@@ -0,0 +1,227 @@
+"""
+PLP Async Client Implementation
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+from .client import (
+    PLPError,
+    PromptEnvelope,
+    PromptInput,
+    PromptRef,
+    _error_from_response,
+    _loads,
+    _validate_id,
+    _split_ref,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncPLPClient:
+    """
+    Asynchronous Python client for PLP (Prompt Library Protocol).
+
+    Requests share a single ``httpx.AsyncClient`` (HTTP/2 enabled), so many
+    prompts can be fetched concurrently over one pooled connection.
+
+    Example:
+        >>> async with AsyncPLPClient("https://prompts.goreal.ai") as client:
+        ...     prompts = await client.get_many(["a/prompt", "b/prompt"])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 10,
+        max_connections: int = 256,
+        keepalive_expiry: float = 75.0,
+    ) -> None:
+        """
+        Initialize async PLP client.
+
+        Args:
+            base_url: Base URL of the PLP server (e.g., "https://prompts.goreal.ai")
+            api_key: Optional API key for authentication
+            headers: Optional additional HTTP headers
+            timeout: Request timeout in seconds (default: 10)
+            max_connections: Maximum number of concurrent connections, all of
+                which are kept alive between requests (default: 256)
+            keepalive_expiry: Seconds an idle connection is kept open
+                (default: 75)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncPLPClient requires httpx. "
+                "Install it with: pip install 'plp-client[async]'"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.headers = headers or {}
+        self.timeout = timeout
+
+        base_headers = dict(self.headers)
+        if api_key:
+            base_headers["Authorization"] = f"Bearer {api_key}"
+        self._write_headers = {"Content-Type": "application/json"}
+        self._prompts_base = f"{self.base_url}/v1/prompts/"
+
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+            headers=base_headers,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """Make an HTTP request with an optional pre-encoded JSON body."""
+        try:
+            if data is None:
+                response = await self._client.request(method=method, url=url)
+            else:
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    content=data,
+                    headers=self._write_headers,
+                )
+
+            if not response.is_success:
+                raise _error_from_response(response)
+
+            # Handle 204 No Content
+            if response.status_code == 204:
+                return None
+
+            return _loads(response.content)
+
+        except httpx.TimeoutException:
+            raise PLPError(f"Request timeout after {self.timeout}s")
+        except httpx.HTTPError as e:
+            raise PLPError(f"Network error: {str(e)}")
+        except ValueError as e:
+            raise PLPError(f"Invalid JSON response: {str(e)}")
+
+    def _prompt_url(self, prompt_id: str, version: Optional[str] = None) -> str:
+        """Build the URL of a prompt, or of one of its versions."""
+        if version:
+            return (
+                self._prompts_base
+                + _validate_id(prompt_id)
+                + "/"
+                + quote(version, safe="")
+            )
+        return self._prompts_base + _validate_id(prompt_id)
+
+    async def get(
+        self, prompt_id: str, version: Optional[str] = None
+    ) -> PromptEnvelope:
+        """
+        Retrieve a prompt by ID and optional version.
+
+        Args:
+            prompt_id: The unique prompt identifier (e.g., "marketing/welcome-email")
+            version: Optional version string (e.g., "1.2.0"). If omitted, returns latest.
+
+        Returns:
+            PromptEnvelope: The prompt envelope
+
+        Raises:
+            PLPError: If the prompt is not found or other errors occur
+        """
+        data = await self._request("GET", self._prompt_url(prompt_id, version))
+        return PromptEnvelope.from_dict(data)
+
+    async def get_many(self, prompt_refs: Iterable[PromptRef]) -> List[PromptEnvelope]:
+        """
+        Retrieve several prompts concurrently.
+
+        Args:
+            prompt_refs: Prompt IDs, or (prompt_id, version) tuples for
+                specific versions
+
+        Returns:
+            The prompt envelopes, in the same order as ``prompt_refs``
+
+        Raises:
+            PLPError: If any of the prompts cannot be retrieved
+        """
+        refs = [_split_ref(ref) for ref in prompt_refs]
+        # Fetch each distinct prompt once, even if it is listed several times
+        unique = list(dict.fromkeys(refs))
+        envelopes = await asyncio.gather(*(self.get(*ref) for ref in unique))
+        fetched = dict(zip(unique, envelopes))
+        return [fetched[ref] for ref in refs]
+
+    async def put(self, prompt_id: str, input: PromptInput) -> PromptEnvelope:
+        """
+        Create or update a prompt (idempotent upsert).
+
+        Args:
+            prompt_id: The unique prompt identifier
+            input: The prompt content and metadata
+
+        Returns:
+            PromptEnvelope: The saved prompt envelope
+
+        Raises:
+            PLPError: If the request fails
+        """
+        data = await self._request(
+            "PUT", self._prompt_url(prompt_id), data=input.to_json_bytes()
+        )
+        return PromptEnvelope.from_dict(data)
+
+    async def delete(self, prompt_id: str) -> None:
+        """
+        Delete a prompt and all its versions.
+
+        Args:
+            prompt_id: The unique prompt identifier
+
+        Raises:
+            PLPError: If the prompt is not found or other errors occur
+        """
+        await self._request("DELETE", self._prompt_url(prompt_id))
+
+    async def fetch(
+        self, prompt_id: str, version: Optional[str] = None
+    ) -> PromptEnvelope:
+        """Alias for get() - more intuitive naming."""
+        return await self.get(prompt_id, version)
+
+    async def save(self, prompt_id: str, input: PromptInput) -> PromptEnvelope:
+        """Alias for put() - more intuitive naming."""
+        return await self.put(prompt_id, input)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPLPClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
@@ -2,208 +2,40 @@
 PLP Client Implementation
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from time import monotonic
+from urllib.parse import quote
+import re
+import socket
+import threading
 import requests
-
-# =============================================================================
-# Multi-modal Content Types
-# =============================================================================
-
-
-@dataclass
-class TextContent:
-    """Text content part."""
-
-    type: str  # Always "text"
-    text: str
-
-    def __init__(self, text: str) -> None:
-        self.type = "text"
-        self.text = text
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"type": self.type, "text": self.text}
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "TextContent":
-        return cls(text=data["text"])
-
-
-@dataclass
-class ImageUrl:
-    """Image URL with optional detail level."""
-
-    url: str
-    detail: Optional[str] = None  # "auto" | "low" | "high"
-
-    def to_dict(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {"url": self.url}
-        if self.detail:
-            result["detail"] = self.detail
-        return result
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ImageUrl":
-        return cls(url=data["url"], detail=data.get("detail"))
-
-
-@dataclass
-class ImageContent:
-    """Image content part."""
-
-    type: str  # Always "image_url"
-    image_url: ImageUrl
-
-    def __init__(self, image_url: ImageUrl) -> None:
-        self.type = "image_url"
-        self.image_url = image_url
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"type": self.type, "image_url": self.image_url.to_dict()}
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ImageContent":
-        return cls(image_url=ImageUrl.from_dict(data["image_url"]))
-
-
-# Type aliases
-ContentPart = Union[TextContent, ImageContent]
-PromptContent = Union[str, List[ContentPart]]
-
-
-def content_part_from_dict(data: Dict[str, Any]) -> ContentPart:
-    """Create a ContentPart from a dictionary."""
-    if data["type"] == "text":
-        return TextContent.from_dict(data)
-    elif data["type"] == "image_url":
-        return ImageContent.from_dict(data)
-    else:
-        raise ValueError(f"Unknown content part type: {data['type']}")
-
-
-def content_from_dict(data: Union[str, List[Dict[str, Any]]]) -> PromptContent:
-    """Create PromptContent from a dictionary or string."""
-    if isinstance(data, str):
-        return data
-    return [content_part_from_dict(part) for part in data]
-
-
-def content_to_dict(content: PromptContent) -> Union[str, List[Dict[str, Any]]]:
-    """Convert PromptContent to dictionary or string."""
-    if isinstance(content, str):
-        return content
-    return [part.to_dict() for part in content]
-
-
-# =============================================================================
-# Helper Functions
-# =============================================================================
-
-
-def is_multi_modal(prompt: Union["PromptEnvelope", PromptContent]) -> bool:
-    """
-    Check if a prompt has multi-modal content (images).
-
-    Args:
-        prompt: The prompt envelope or content
-
-    Returns:
-        True if content contains image parts
-    """
-    if isinstance(prompt, PromptEnvelope):
-        content = prompt.content
-    else:
-        content = prompt
-
-    if isinstance(content, str):
-        return False
-
-    return any(isinstance(part, ImageContent) for part in content)
-
-
-def normalize_content(content: PromptContent) -> List[ContentPart]:
-    """
-    Normalize content to ContentPart[] format.
-
-    Args:
-        content: String or ContentPart array
-
-    Returns:
-        ContentPart[] (string is wrapped as single TextContent)
-    """
-    if isinstance(content, str):
-        return [TextContent(text=content)]
-    return content
-
-
-def get_text_content(content: PromptContent) -> str:
-    """
-    Get text-only content from a prompt (useful for token counting).
-
-    Args:
-        content: String or ContentPart array
-
-    Returns:
-        Combined text from all text parts
-    """
-    if isinstance(content, str):
-        return content
-
-    text_parts = [part.text for part in content if isinstance(part, TextContent)]
-    return "\n".join(text_parts)
-
-
-# =============================================================================
-# Prompt Types
-# =============================================================================
-
-
-class PromptEnvelope:
-    """Represents a PLP prompt envelope."""
-
-    def __init__(self, id: str, content: PromptContent, meta: Dict[str, Any]) -> None:
-        self.id = id
-        self.content = content
-        self.meta = meta
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "PromptEnvelope":
-        """Create a PromptEnvelope from a dictionary."""
-        return cls(
-            id=data["id"],
-            content=content_from_dict(data["content"]),
-            meta=data.get("meta", {}),
-        )
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "content": content_to_dict(self.content),
-            "meta": self.meta,
-        }
-
-    def __repr__(self) -> str:
-        return f"PromptEnvelope(id='{self.id}', version={self.meta.get('version', 'latest')})"
-
-
-class PromptInput:
-    """Input for creating/updating a prompt."""
-
-    def __init__(
-        self, content: PromptContent, meta: Optional[Dict[str, Any]] = None
-    ) -> None:
-        self.content = content
-        self.meta = meta or {}
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "content": content_to_dict(self.content),
-            "meta": self.meta,
-        }
-
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# Content types and helpers live in ._content (a mypyc compilation target);
+# they are re-exported here so ``plp_client.client`` keeps its public names.
+from ._content import (  # noqa: F401
+    ContentPart,
+    ImageContent,
+    ImageUrl,
+    PromptContent,
+    PromptEnvelope,
+    PromptInput,
+    TextContent,
+    _dumps,
+    _loads,
+    content_from_dict,
+    content_part_from_dict,
+    content_to_dict,
+    get_text_content,
+    is_multi_modal,
+    normalize_content,
+)
 
 # =============================================================================
 # Context Store Types
@@ -214,6 +46,16 @@ class PromptInput:
 class ContextStoreAsset:
     """Represents a Context Store asset."""
 
+    __slots__ = (
+        "id",
+        "asset_id",
+        "mime_type",
+        "file_size",
+        "plp_reference",
+        "project_id",
+        "created_at",
+    )
+
     id: int
     asset_id: str
     mime_type: str
@@ -240,6 +82,8 @@ class ContextStoreAsset:
 class AssetContent:
     """Asset content with base64 data URL."""
 
+    __slots__ = ("asset_id", "mime_type", "data_url")
+
     asset_id: str
     mime_type: str
     data_url: str
@@ -258,6 +102,8 @@ class AssetContent:
 class StorageUsage:
     """Storage usage statistics."""
 
+    __slots__ = ("bytes_used", "asset_count")
+
     bytes_used: int
     asset_count: int
 
@@ -279,6 +125,15 @@ class StorageUsage:
 class ContextMapping:
     """Represents a prompt context mapping."""
 
+    __slots__ = (
+        "id",
+        "context_name",
+        "asset_id",
+        "mime_type",
+        "plp_reference",
+        "created_at",
+    )
+
     id: int
     context_name: str
     asset_id: str
@@ -303,6 +158,8 @@ class ContextMapping:
 class ResolvedContext:
     """Resolved context content."""
 
+    __slots__ = ("context_name", "asset_id", "mime_type", "data_url")
+
     context_name: str
     asset_id: str
     mime_type: str
@@ -328,6 +185,8 @@ class ResolvedContext:
 class DeployResponse:
     """Response from deploying a prompt version."""
 
+    __slots__ = ("prompt_id", "version_no", "environment", "deployed_at")
+
     prompt_id: str
     version_no: int
     environment: str
@@ -397,6 +256,8 @@ class EvalTestResult:
 class EvalSummary:
     """Summary of eval suite results."""
 
+    __slots__ = ("total", "passed", "failed", "duration_ms")
+
     total: int
     passed: int
     failed: int
@@ -417,6 +278,8 @@ class EvalSummary:
 class EvalSuiteResult:
     """Result of running an eval suite."""
 
+    __slots__ = ("suite_name", "status", "tests", "summary")
+
     suite_name: str
     status: str  # "pass" | "fail" | "error"
     tests: List[EvalTestResult]
@@ -506,11 +369,78 @@ class PLPError(Exception):
         self.response = response
 
 
+def _error_from_response(response: Any) -> PLPError:
+    """
+    Build a PLPError for a failed requests/httpx response.
+
+    The body is only decoded as JSON when the server says it is JSON, so
+    plain-text or HTML error pages keep their status code.
+    """
+    status_code = response.status_code
+    data = None
+    if "json" in response.headers.get("Content-Type", "") and response.content:
+        try:
+            data = _loads(response.content)
+        except ValueError:
+            pass
+
+    if isinstance(data, dict):
+        return PLPError(data.get("error", f"HTTP {status_code}"), status_code, data)
+
+    snippet = response.text[:200].strip()
+    message = f"HTTP {status_code}: {snippet}" if snippet else f"HTTP {status_code}"
+    return PLPError(message, status_code)
+
+
 # =============================================================================
 # PLP Client
 # =============================================================================
 
 
+# A prompt ID (latest version) or a (prompt_id, version) pair
+PromptRef = Union[str, Tuple[str, Optional[str]]]
+
+# (prompt_id, version) -> (expires_at, etag, envelope)
+_CacheKey = Tuple[str, Optional[str]]
+_CacheEntry = Tuple[float, Optional[str], PromptEnvelope]
+
+
+# Prompt ID format from spec/plp-schema.json
+_PROMPT_ID_RE = re.compile(r"[A-Za-z0-9_-]+(?:/[A-Za-z0-9_-]+)*")
+
+
+@lru_cache(maxsize=1024)
+def _validate_id(prompt_id: str) -> str:
+    """
+    Check a prompt ID against the spec before any network I/O.
+
+    Valid IDs only contain URL-safe characters, so they are returned as-is
+    for use in request paths. Results are memoized since IDs recur.
+    """
+    if len(prompt_id) > 256 or not _PROMPT_ID_RE.fullmatch(prompt_id):
+        raise PLPError(f"Invalid prompt id: {prompt_id!r}")
+    return prompt_id
+
+
+def _split_ref(ref: PromptRef) -> Tuple[str, Optional[str]]:
+    """Normalize a PromptRef to a (prompt_id, version) pair."""
+    if isinstance(ref, str):
+        return ref, None
+    return ref
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keep-alive on pooled connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options
+            + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
 class PLPClient:
     """
     Official Python client for PLP (Prompt Library Protocol).
@@ -527,6 +457,9 @@ class PLPClient:
         api_key: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 10,
+        pool_size: int = 32,
+        cache_ttl: float = 60.0,
+        cache_size: int = 1024,
     ) -> None:
         """
         Initialize PLP client.
@@ -536,61 +469,156 @@ class PLPClient:
             api_key: Optional API key for authentication
             headers: Optional additional HTTP headers
             timeout: Request timeout in seconds (default: 10)
+            pool_size: Maximum number of pooled keep-alive connections (default: 32)
+            cache_ttl: Seconds a fetched prompt is served from memory before
+                it is revalidated with the server (default: 60, 0 disables)
+            cache_size: Maximum number of cached prompts (default: 1024)
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.headers = headers or {}
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
         self.session = requests.Session()
 
-    def _request(
+        # Reuse warm connections and retry transient gateway errors on
+        # idempotent methods only. DELETE is not idempotent per the spec (a
+        # repeated delete returns 404), and a server's Retry-After is ignored
+        # so a retry never waits longer than the short backoff.
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET", "PUT"],
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._pool_size = pool_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Set once on the session, so reads send no per-request headers and
+        # writes only add Content-Type
+        self.session.headers["Accept"] = "application/json"
+        self.session.headers.update(self.headers)
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+        self._write_headers = {"Content-Type": "application/json"}
+        self._prompts_base = f"{self.base_url}/v1/prompts/"
+
+        # Fetched prompts, least recently used first; guarded by _lock
+        self._cache: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _send(
         self,
         method: str,
-        path: str,
+        url: str,
         json: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """Make an HTTP request to the PLP server."""
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Content-Type": "application/json",
-            **self.headers,
-        }
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[bytes] = None,
+    ) -> requests.Response:
+        """Send an HTTP request to an absolute PLP server URL.
 
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        The body is either ``json``, encoded here, or pre-encoded ``data``.
+        """
+        if json is not None:
+            data = _dumps(json)
+        if headers is None and data is not None:
+            headers = self._write_headers
 
         try:
-            response = self.session.request(
+            return self.session.request(
                 method=method,
                 url=url,
-                json=json,
+                data=data,
                 headers=headers,
                 timeout=self.timeout,
             )
-
-            # Handle 204 No Content
-            if response.status_code == 204:
-                return None
-
-            data = response.json()
-
-            if not response.ok:
-                error_message = data.get("error", f"HTTP {response.status_code}")
-                raise PLPError(error_message, response.status_code, data)
-
-            return data
-
         except requests.exceptions.Timeout:
             raise PLPError(f"Request timeout after {self.timeout}s")
         except requests.exceptions.RequestException as e:
             raise PLPError(f"Network error: {str(e)}")
+
+    def _parse_response(self, response: requests.Response) -> Any:
+        """Decode a PLP server response, raising PLPError on failure."""
+        if not response.ok:
+            raise _error_from_response(response)
+
+        # Handle 204 No Content
+        if response.status_code == 204:
+            return None
+
+        try:
+            return _loads(response.content)
         except ValueError as e:
             raise PLPError(f"Invalid JSON response: {str(e)}")
 
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make an HTTP request to the PLP server."""
+        return self._parse_response(self._send(method, self.base_url + path, json))
+
+    def _prompt_url(self, prompt_id: str, version: Optional[str] = None) -> str:
+        """Build the URL of a prompt, or of one of its versions."""
+        if version:
+            return (
+                self._prompts_base
+                + _validate_id(prompt_id)
+                + "/"
+                + quote(version, safe="")
+            )
+        return self._prompts_base + _validate_id(prompt_id)
+
+    def _cache_store(
+        self,
+        key: _CacheKey,
+        etag: Optional[str],
+        envelope: PromptEnvelope,
+    ) -> None:
+        """Store a fetched prompt, evicting the least recently used entries."""
+        with self._lock:
+            self._cache[key] = (monotonic() + self.cache_ttl, etag, envelope)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, prompt_id: Optional[str] = None) -> None:
+        """
+        Drop cached prompts so the next get() fetches them from the server.
+
+        put() and delete() already do this for the prompts they change; call
+        it when a prompt may have been changed by another client.
+
+        Args:
+            prompt_id: Prompt whose cached versions are dropped. If omitted,
+                the whole cache is cleared.
+        """
+        with self._lock:
+            if prompt_id is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == prompt_id]:
+                del self._cache[key]
+
     def get(self, prompt_id: str, version: Optional[str] = None) -> PromptEnvelope:
         """
         Retrieve a prompt by ID and optional version.
 
+        Fetched prompts are kept in memory for ``cache_ttl`` seconds. Once an
+        entry expires it is revalidated with ``If-None-Match``, so an
+        unchanged prompt costs a 304 round trip without a new download.
+
         Args:
             prompt_id: The unique prompt identifier (e.g., "marketing/welcome-email")
             version: Optional version string (e.g., "1.2.0"). If omitted, returns latest.
@@ -601,13 +629,64 @@ class PLPClient:
         Raises:
             PLPError: If the prompt is not found or other errors occur
         """
-        path = (
-            f"/v1/prompts/{prompt_id}/{version}"
-            if version
-            else f"/v1/prompts/{prompt_id}"
-        )
-        data = self._request("GET", path)
-        return PromptEnvelope.from_dict(data)
+        url = self._prompt_url(prompt_id, version)
+        if self.cache_ttl <= 0:
+            return PromptEnvelope.from_dict(
+                self._parse_response(self._send("GET", url))
+            )
+
+        key = (prompt_id, version)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and monotonic() < cached[0]:
+                self._cache.move_to_end(key)
+                return cached[2]
+
+        headers = None
+        if cached is not None and cached[1]:
+            headers = {"If-None-Match": cached[1]}
+
+        response = self._send("GET", url, headers=headers)
+        if cached is not None and response.status_code == 304:
+            etag, envelope = cached[1], cached[2]
+        else:
+            envelope = PromptEnvelope.from_dict(self._parse_response(response))
+            etag = response.headers.get("ETag")
+
+        self._cache_store(key, etag, envelope)
+        return envelope
+
+    def get_many(self, prompt_refs: Iterable[PromptRef]) -> List[PromptEnvelope]:
+        """
+        Retrieve several prompts concurrently over the pooled session.
+
+        Args:
+            prompt_refs: Prompt IDs, or (prompt_id, version) tuples for
+                specific versions
+
+        Returns:
+            The prompt envelopes, in the same order as ``prompt_refs``
+
+        Raises:
+            PLPError: If any of the prompts cannot be retrieved
+        """
+        refs = [_split_ref(ref) for ref in prompt_refs]
+        # Fetch each distinct prompt once, even if it is listed several times
+        unique = list(dict.fromkeys(refs))
+        if len(unique) <= 1:
+            return [self.get(*ref) for ref in refs]
+
+        with self._lock:
+            if self._executor is None:
+                # Never more workers than pooled connections, so threads do
+                # not queue on the connection pool.
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size, thread_name_prefix="plp-client"
+                )
+            executor = self._executor
+
+        fetched = dict(zip(unique, executor.map(lambda ref: self.get(*ref), unique)))
+        return [fetched[ref] for ref in refs]
 
     def put(self, prompt_id: str, input: PromptInput) -> PromptEnvelope:
         """
@@ -623,8 +702,10 @@ class PLPClient:
         Raises:
             PLPError: If the request fails
         """
-        path = f"/v1/prompts/{prompt_id}"
-        data = self._request("PUT", path, json=input.to_dict())
+        data = self._parse_response(
+            self._send("PUT", self._prompt_url(prompt_id), data=input.to_json_bytes())
+        )
+        self.invalidate(prompt_id)
         return PromptEnvelope.from_dict(data)
 
     def delete(self, prompt_id: str) -> None:
@@ -637,8 +718,8 @@ class PLPClient:
         Raises:
             PLPError: If the prompt is not found or other errors occur
         """
-        path = f"/v1/prompts/{prompt_id}"
-        self._request("DELETE", path)
+        self._parse_response(self._send("DELETE", self._prompt_url(prompt_id)))
+        self.invalidate(prompt_id)
 
     def fetch(self, prompt_id: str, version: Optional[str] = None) -> PromptEnvelope:
         """Alias for get() - more intuitive naming."""
@@ -714,7 +795,7 @@ class PLPClient:
         Returns:
             List of context mappings
         """
-        data = self._request("GET", f"/v1/prompts/{prompt_id}/context")
+        data = self._request("GET", f"/v1/prompts/{_validate_id(prompt_id)}/context")
         return [ContextMapping.from_dict(item) for item in data]
 
     def add_prompt_context(
@@ -733,7 +814,7 @@ class PLPClient:
         """
         data = self._request(
             "POST",
-            f"/v1/prompts/{prompt_id}/context",
+            f"/v1/prompts/{_validate_id(prompt_id)}/context",
             json={"contextName": context_name, "assetId": asset_id},
         )
         return ContextMapping.from_dict(data)
@@ -746,7 +827,9 @@ class PLPClient:
             prompt_id: The prompt identifier
             context_name: The context name to remove
         """
-        self._request("DELETE", f"/v1/prompts/{prompt_id}/context/{context_name}")
+        self._request(
+            "DELETE", f"/v1/prompts/{_validate_id(prompt_id)}/context/{context_name}"
+        )
 
     def resolve_prompt_context(
         self, prompt_id: str, context_names: Optional[List[str]] = None
@@ -766,7 +849,7 @@ class PLPClient:
             body["contextNames"] = context_names
 
         data = self._request(
-            "POST", f"/v1/prompts/{prompt_id}/context/_resolve", json=body
+            "POST", f"/v1/prompts/{_validate_id(prompt_id)}/context/_resolve", json=body
         )
         return {name: ResolvedContext.from_dict(value) for name, value in data.items()}
 
@@ -790,7 +873,7 @@ class PLPClient:
         """
         data = self._request(
             "POST",
-            f"/v1/prompts/{prompt_id}/deploy",
+            f"/v1/prompts/{_validate_id(prompt_id)}/deploy",
             json={"versionNo": version_no, "environment": environment},
         )
         return DeployResponse.from_dict(data)
@@ -826,7 +909,7 @@ class PLPClient:
 
         data = self._request(
             "POST",
-            f"/v1/prompts/{prompt_id}/eval",
+            f"/v1/prompts/{_validate_id(prompt_id)}/eval",
             json=body,
         )
         return EvalSuiteResult.from_dict(data)
@@ -847,7 +930,7 @@ class PLPClient:
         """
         data = self._request(
             "PUT",
-            f"/v1/prompts/{prompt_id}/eval/datasets/{dataset_id}",
+            f"/v1/prompts/{_validate_id(prompt_id)}/eval/datasets/{dataset_id}",
             json=dataset.to_dict(),
         )
         return EvalDataset.from_dict(data)
@@ -865,7 +948,7 @@ class PLPClient:
         """
         data = self._request(
             "GET",
-            f"/v1/prompts/{prompt_id}/eval/datasets/{dataset_id}",
+            f"/v1/prompts/{_validate_id(prompt_id)}/eval/datasets/{dataset_id}",
         )
         return EvalDataset.from_dict(data)
 
@@ -875,4 +958,7 @@ class PLPClient:
 
     def __exit__(self, *args: Any) -> None:
         """Context manager exit."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self.session.close()
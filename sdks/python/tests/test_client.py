@@ -2,13 +2,21 @@
 Tests for PLP client
 """
 
+import asyncio
+import json
+from typing import NamedTuple
+
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import AsyncMock, patch
+from plp_client.client import content_part_from_dict
 from plp_client import (
+    AsyncPLPClient,
     PLPClient,
     PLPError,
     PromptInput,
     PromptEnvelope,
+    StorageUsage,
     TextContent,
     ImageUrl,
     ImageContent,
@@ -18,19 +26,87 @@ from plp_client import (
 )
 
 
+def json_body(payload):
+    """Encode a payload the way the PLP server sends it."""
+    return json.dumps(payload).encode("utf-8")
+
+
+class FakeResponse:
+    """Lightweight stand-in for a requests or httpx response."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, payload=None, status_code=200, headers=None, content=b""):
+        self.status_code = status_code
+        self.headers = (
+            {"Content-Type": "application/json"} if headers is None else headers
+        )
+        self.content = json_body(payload) if payload is not None else content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def is_success(self):
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+
+class RecordedCall(NamedTuple):
+    """A request sent through the recording session."""
+
+    method: str
+    url: str
+    body: object
+    headers: object
+
+
+class RecordingSession:
+    """
+    Stand-in for ``requests.Session.request`` that records each request.
+
+    ``response`` is returned for every request; it may instead be a callable
+    taking ``(method, url)`` for tests that answer per URL.
+    """
+
+    __slots__ = ("calls", "response")
+
+    def __init__(self):
+        self.calls = []
+        self.response = None
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        body = json.loads(data) if data is not None else None
+        self.calls.append(RecordedCall(method, url, body, headers))
+        if callable(self.response):
+            return self.response(method, url)
+        return self.response
+
+
 @pytest.fixture
-def client():
-    """Create a test client."""
-    return PLPClient("https://prompts.example.com")
+def session(monkeypatch):
+    """Route every PLPClient request through a RecordingSession."""
+    recorder = RecordingSession()
+    monkeypatch.setattr(requests.Session, "request", recorder.request)
+    return recorder
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Create one test client for the whole module."""
+    with PLPClient("https://prompts.example.com") as client:
+        yield client
 
 
 @pytest.fixture
-def mock_response():
-    """Create a mock response object."""
-    mock = Mock()
-    mock.ok = True
-    mock.status_code = 200
-    return mock
+def client(shared_client):
+    """Return the shared test client with an empty prompt cache."""
+    shared_client.invalidate()
+    return shared_client
 
 
 def test_client_initialization():
@@ -47,92 +123,112 @@ def test_client_initialization_strips_trailing_slash():
     assert client.base_url == "https://prompts.example.com"
 
 
-@patch("plp_client.client.requests.Session.request")
-def test_get_prompt(mock_request, client):
+def test_client_connection_pool():
+    """Test that a tuned keep-alive adapter with retries is mounted."""
+    client = PLPClient("https://prompts.example.com", pool_size=8)
+    adapter = client.session.get_adapter("https://prompts.example.com")
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert "DELETE" not in adapter.max_retries.allowed_methods
+    assert adapter.max_retries.respect_retry_after_header is False
+
+
+def test_get_prompt(session, client):
     """Test getting a prompt."""
-    mock_response = Mock()
-    mock_response.ok = True
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": "test/prompt",
-        "content": "Hello {{name}}",
-        "meta": {"version": "1.0.0"},
-    }
-    mock_request.return_value = mock_response
+    session.response = FakeResponse(
+        {
+            "id": "test/prompt",
+            "content": "Hello {{name}}",
+            "meta": {"version": "1.0.0"},
+        }
+    )
 
     prompt = client.get("test/prompt")
 
     assert prompt.id == "test/prompt"
     assert prompt.content == "Hello {{name}}"
     assert prompt.meta["version"] == "1.0.0"
-    mock_request.assert_called_once()
+    assert len(session.calls) == 1
 
 
-@patch("plp_client.client.requests.Session.request")
-def test_get_prompt_with_version(mock_request, client):
+def test_get_prompt_with_version(session, client):
     """Test getting a prompt with specific version."""
-    mock_response = Mock()
-    mock_response.ok = True
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": "test/prompt",
-        "content": "Hello {{name}}",
-        "meta": {"version": "1.0.0"},
-    }
-    mock_request.return_value = mock_response
+    session.response = FakeResponse(
+        {
+            "id": "test/prompt",
+            "content": "Hello {{name}}",
+            "meta": {"version": "1.0.0"},
+        }
+    )
 
     prompt = client.get("test/prompt", "1.0.0")
 
     assert prompt.id == "test/prompt"
     # Verify the version was included in the URL
-    call_args = mock_request.call_args
-    assert "/v1/prompts/test/prompt/1.0.0" in call_args[1]["url"]
+    assert "/v1/prompts/test/prompt/1.0.0" in session.calls[0].url
+
 
+def test_get_prompt_escapes_version(session, client):
+    """Test that the version segment is URL-escaped."""
+    session.response = FakeResponse({"id": "x", "content": "", "meta": {}})
 
-@patch("plp_client.client.requests.Session.request")
-def test_put_prompt(mock_request, client):
+    client.get("test/prompt", "1.0.0+build.5")
+
+    url = session.calls[-1].url
+    assert url.endswith("/v1/prompts/test/prompt/1.0.0%2Bbuild.5")
+
+
+@pytest.mark.parametrize(
+    "prompt_id", ["", "/leading", "trailing/", "a//b", "../etc", "has space", "x" * 257]
+)
+def test_invalid_prompt_id_rejected_before_request(session, client, prompt_id):
+    """Test that malformed prompt IDs fail without a network round trip."""
+    with pytest.raises(PLPError, match="Invalid prompt id"):
+        client.get(prompt_id)
+    with pytest.raises(PLPError, match="Invalid prompt id"):
+        client.delete(prompt_id)
+
+    assert not session.calls
+
+
+def test_put_prompt(session, client):
     """Test creating/updating a prompt."""
-    mock_response = Mock()
-    mock_response.ok = True
-    mock_response.status_code = 201
-    mock_response.json.return_value = {
-        "id": "test/new",
-        "content": "New prompt",
-        "meta": {"version": "1.0.0"},
-    }
-    mock_request.return_value = mock_response
+    session.response = FakeResponse(
+        {
+            "id": "test/new",
+            "content": "New prompt",
+            "meta": {"version": "1.0.0"},
+        },
+        status_code=201,
+    )
 
     input_data = PromptInput(content="New prompt", meta={"version": "1.0.0"})
     prompt = client.put("test/new", input_data)
 
     assert prompt.id == "test/new"
     assert prompt.content == "New prompt"
-    mock_request.assert_called_once()
+    assert len(session.calls) == 1
 
 
-@patch("plp_client.client.requests.Session.request")
-def test_delete_prompt(mock_request, client):
+def test_delete_prompt(session, client):
     """Test deleting a prompt."""
-    mock_response = Mock()
-    mock_response.ok = True
-    mock_response.status_code = 204
-    mock_request.return_value = mock_response
+    session.response = FakeResponse(status_code=204)
 
     client.delete("test/old")
 
-    mock_request.assert_called_once()
-    call_args = mock_request.call_args
-    assert call_args[1]["method"] == "DELETE"
+    assert len(session.calls) == 1
+    assert session.calls[0].method == "DELETE"
 
 
-@patch("plp_client.client.requests.Session.request")
-def test_error_handling_404(mock_request, client):
+def test_error_handling_404(session, client):
     """Test error handling for 404."""
-    mock_response = Mock()
-    mock_response.ok = False
-    mock_response.status_code = 404
-    mock_response.json.return_value = {"error": "Prompt not found"}
-    mock_request.return_value = mock_response
+    session.response = FakeResponse(
+        {"error": "Prompt not found"},
+        status_code=404,
+        headers={"Content-Type": "application/json; charset=utf-8"},
+    )
 
     with pytest.raises(PLPError) as exc_info:
         client.get("missing/prompt")
@@ -141,31 +237,161 @@ def test_error_handling_404(mock_request, client):
     assert exc_info.value.status_code == 404
 
 
-@patch("plp_client.client.requests.Session.request")
-def test_authentication_header(mock_request):
+def test_error_handling_plain_text(session, client):
+    """Test that a non-JSON error body keeps the HTTP status."""
+    session.response = FakeResponse(
+        content=b"Service Unavailable",
+        status_code=503,
+        headers={"Content-Type": "text/plain"},
+    )
+
+    with pytest.raises(PLPError) as exc_info:
+        client.get("test/prompt")
+
+    assert str(exc_info.value) == "HTTP 503: Service Unavailable"
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.response is None
+
+
+def test_authentication_header(session):
     """Test that authentication header is included."""
     client = PLPClient("https://prompts.example.com", api_key="test-key-123")
 
-    mock_response = Mock()
-    mock_response.ok = True
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": "test/prompt",
-        "content": "Test",
-        "meta": {},
-    }
-    mock_request.return_value = mock_response
+    session.response = FakeResponse(
+        {
+            "id": "test/prompt",
+            "content": "Test",
+            "meta": {},
+        }
+    )
 
     client.get("test/prompt")
 
-    call_args = mock_request.call_args
-    headers = call_args[1]["headers"]
-    assert "Authorization" in headers
-    assert headers["Authorization"] == "Bearer test-key-123"
+    # Set once on the session rather than passed with each request
+    assert client.session.headers["Authorization"] == "Bearer test-key-123"
+    assert session.calls[-1].headers is None
+
+
+def test_get_many(session, client):
+    """Test fetching several prompts concurrently preserves order."""
+
+    def respond(method, url, **kwargs):
+        prompt_id = url.split("/v1/prompts/", 1)[1]
+        return FakeResponse({"id": prompt_id, "content": "", "meta": {}})
+
+    session.response = respond
+
+    prompts = client.get_many(["a/one", ("b/two", "2.0.0"), "c/three", "a/one"])
+
+    assert [p.id for p in prompts] == ["a/one", "b/two/2.0.0", "c/three", "a/one"]
+    # Repeated refs are fetched once
+    assert prompts[3] is prompts[0]
+    assert len(session.calls) == 3
+
+
+class TestPromptCache:
+    """Tests for the in-memory prompt cache."""
+
+    @staticmethod
+    def _response(status_code=200, etag=None):
+        return FakeResponse(
+            {"id": "test/prompt", "content": "Hello", "meta": {}},
+            status_code=status_code,
+            headers={"ETag": etag} if etag else {},
+        )
+
+    def test_repeated_get_is_served_from_cache(self, session, client):
+        """Test that a fresh cached prompt skips the network."""
+        session.response = self._response()
+
+        first = client.get("test/prompt")
+        second = client.get("test/prompt")
+
+        assert second is first
+        assert len(session.calls) == 1
+
+    @patch("plp_client.client.monotonic")
+    def test_expired_entry_is_revalidated_with_etag(
+        self, mock_monotonic, session, client
+    ):
+        """Test that a stale entry sends If-None-Match and reuses it on 304."""
+        mock_monotonic.return_value = 0.0
+        session.response = self._response(etag='"v1"')
+        first = client.get("test/prompt")
 
+        mock_monotonic.return_value = client.cache_ttl + 1
+        session.response = self._response(status_code=304)
+        second = client.get("test/prompt")
 
-def test_context_manager(client):
+        assert second is first
+        assert len(session.calls) == 2
+        headers = session.calls[-1].headers
+        assert headers["If-None-Match"] == '"v1"'
+
+    def test_put_invalidates_cached_prompt(self, session, client):
+        """Test that writing a prompt drops its cached versions."""
+        session.response = self._response()
+
+        client.get("test/prompt")
+        client.put("test/prompt", PromptInput(content="Hello"))
+        client.get("test/prompt")
+
+        assert len(session.calls) == 3
+
+    def test_invalidate(self, session, client):
+        """Test dropping one prompt, then the whole cache."""
+        session.response = self._response()
+
+        client.get("test/prompt")
+        client.get("test/prompt", "1.0.0")
+        client.invalidate("test/prompt")
+        client.get("test/prompt", "1.0.0")
+        assert len(session.calls) == 3
+
+        client.invalidate()
+        client.get("test/prompt", "1.0.0")
+        assert len(session.calls) == 4
+
+    def test_cache_disabled(self, session):
+        """Test that cache_ttl=0 fetches on every call."""
+        client = PLPClient("https://prompts.example.com", cache_ttl=0)
+        session.response = self._response()
+
+        client.get("test/prompt")
+        client.get("test/prompt")
+
+        assert len(session.calls) == 2
+
+    def test_cache_evicts_least_recently_used(self, session):
+        """Test that the cache never grows past cache_size."""
+        client = PLPClient("https://prompts.example.com", cache_size=2)
+        session.response = self._response()
+
+        for prompt_id in ("a", "b", "a", "c"):
+            client.get(prompt_id)
+
+        assert list(client._cache) == [("a", None), ("c", None)]
+
+
+def test_content_type_only_on_writes(session):
+    """Test that Content-Type is sent with request bodies only."""
+    client = PLPClient("https://prompts.example.com", api_key="k", cache_ttl=0)
+    session.response = FakeResponse({"id": "test/prompt", "content": "", "meta": {}})
+
+    client.get("test/prompt")
+    get_headers = session.calls[-1].headers
+    client.put("test/prompt", PromptInput(content=""))
+    put_headers = session.calls[-1].headers
+
+    assert get_headers is None
+    assert put_headers == {"Content-Type": "application/json"}
+    assert client.session.headers["Authorization"] == "Bearer k"
+    assert client.session.headers["Accept"] == "application/json"
+
+
+def test_context_manager():
     """Test using client as context manager."""
+    client = PLPClient("https://prompts.example.com")
     with client as c:
         assert c is client
 
@@ -190,57 +416,53 @@ def test_prompt_input_to_dict():
 class TestMultiModalContent:
     """Tests for multi-modal content support."""
 
-    @patch("plp_client.client.requests.Session.request")
-    def test_get_multi_modal_prompt(self, mock_request, client):
+    def test_get_multi_modal_prompt(self, session, client):
         """Test getting a multi-modal prompt."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "vision/test",
-            "content": [
-                {"type": "text", "text": "Analyze this image:"},
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": "https://example.com/img.png",
-                        "detail": "high",
+        session.response = FakeResponse(
+            {
+                "id": "vision/test",
+                "content": [
+                    {"type": "text", "text": "Analyze this image:"},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": "https://example.com/img.png",
+                            "detail": "high",
+                        },
                     },
-                },
-            ],
-            "meta": {"version": "1.0.0"},
-        }
-        mock_request.return_value = mock_response
+                ],
+                "meta": {"version": "1.0.0"},
+            }
+        )
 
         prompt = client.get("vision/test")
 
         assert prompt.id == "vision/test"
         assert isinstance(prompt.content, list)
         assert len(prompt.content) == 2
+        # The one place the concrete part classes are pinned
         assert isinstance(prompt.content[0], TextContent)
         assert prompt.content[0].text == "Analyze this image:"
         assert isinstance(prompt.content[1], ImageContent)
         assert prompt.content[1].image_url.url == "https://example.com/img.png"
         assert prompt.content[1].image_url.detail == "high"
 
-    @patch("plp_client.client.requests.Session.request")
-    def test_put_multi_modal_prompt(self, mock_request, client):
+    def test_put_multi_modal_prompt(self, session, client):
         """Test creating a multi-modal prompt."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": "vision/new",
-            "content": [
-                {"type": "text", "text": "Describe this:"},
-                {
-                    "type": "image_url",
-                    "image_url": {"url": "https://example.com/img.png"},
-                },
-            ],
-            "meta": {"version": "1.0.0"},
-        }
-        mock_request.return_value = mock_response
+        session.response = FakeResponse(
+            {
+                "id": "vision/new",
+                "content": [
+                    {"type": "text", "text": "Describe this:"},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": "https://example.com/img.png"},
+                    },
+                ],
+                "meta": {"version": "1.0.0"},
+            },
+            status_code=201,
+        )
 
         input_data = PromptInput(
             content=[
@@ -253,14 +475,14 @@ class TestMultiModalContent:
 
         assert prompt.id == "vision/new"
         assert isinstance(prompt.content, list)
-        mock_request.assert_called_once()
+        assert len(session.calls) == 1
 
         # Verify the request body
-        call_args = mock_request.call_args
-        body = call_args[1]["json"]
+        body = session.calls[0].body
         assert isinstance(body["content"], list)
         assert body["content"][0]["type"] == "text"
         assert body["content"][1]["type"] == "image_url"
+        assert body["content"][1]["image_url"] == {"url": "https://example.com/img.png"}
 
 
 class TestHelperFunctions:
@@ -305,11 +527,38 @@ class TestHelperFunctions:
         )
         assert is_multi_modal(multi_modal_prompt) is True
 
+    def test_is_multi_modal_tracks_in_place_edits(self):
+        """Test is_multi_modal sees parts appended after an earlier call."""
+        envelope = PromptEnvelope("test", [TextContent(text="x")], {})
+        assert is_multi_modal(envelope) is False
+
+        envelope.content.append(
+            ImageContent(image_url=ImageUrl(url="https://example.com/img.png"))
+        )
+        assert is_multi_modal(envelope) is True
+
+    def test_is_multi_modal_with_unparsed_envelope(self):
+        """Test is_multi_modal answers from raw parts and tracks reassignment."""
+        envelope = PromptEnvelope.from_dict(
+            {
+                "id": "test",
+                "content": [
+                    {"type": "image_url", "image_url": {"url": "https://e.com/a.png"}}
+                ],
+                "meta": {},
+            }
+        )
+        assert is_multi_modal(envelope) is True
+        assert envelope._content is None  # parts were not decoded
+
+        envelope.content = "Now text only"
+        assert is_multi_modal(envelope) is False
+
     def test_normalize_content_string(self):
         """Test normalize_content wraps string in TextContent array."""
         result = normalize_content("Hello {{name}}")
         assert len(result) == 1
-        assert isinstance(result[0], TextContent)
+        assert result[0].type == "text"
         assert result[0].text == "Hello {{name}}"
 
     def test_normalize_content_array(self):
@@ -342,6 +591,39 @@ class TestHelperFunctions:
         assert get_text_content(content) == ""
 
 
+class TestRender:
+    """Tests for PromptEnvelope.render."""
+
+    def test_render_string_content(self):
+        """Test all variables are substituted, with optional inner spaces."""
+        prompt = PromptEnvelope(
+            id="test",
+            content="Hello {{name}}, welcome to {{ product }}! Bye {{name}}.",
+            meta={},
+        )
+        rendered = prompt.render({"name": "Alice", "product": "PLP"})
+        assert rendered == "Hello Alice, welcome to PLP! Bye Alice."
+
+    def test_render_multi_modal_content(self):
+        """Test only text parts are rendered and images pass through."""
+        image = ImageContent(image_url=ImageUrl(url="https://example.com/img.png"))
+        prompt = PromptEnvelope(
+            id="test",
+            content=[TextContent(text="Describe {{subject}}:"), image],
+            meta={},
+        )
+        rendered = prompt.render({"subject": "the chart"})
+        assert rendered[0].text == "Describe the chart:"
+        assert rendered[1] is image
+        assert prompt.content[0].text == "Describe {{subject}}:"
+
+    def test_render_missing_variable(self):
+        """Test a missing variable raises KeyError."""
+        prompt = PromptEnvelope(id="test", content="Hi {{name}}", meta={})
+        with pytest.raises(KeyError):
+            prompt.render({})
+
+
 class TestContentTypes:
     """Tests for multi-modal content types."""
 
@@ -390,6 +672,71 @@ class TestContentTypes:
         assert content.image_url.url == "https://example.com/img.png"
         assert content.image_url.detail == "low"
 
+    def test_to_json_bytes(self):
+        """Test serializing content types and envelopes straight to JSON bytes."""
+        part = ImageContent(image_url=ImageUrl(url="https://example.com/img.png"))
+        assert json.loads(part.to_json_bytes()) == part.to_dict()
+
+        envelope = PromptEnvelope.from_dict(
+            {
+                "id": "test/prompt",
+                "content": [{"type": "text", "text": "Hi"}],
+                "meta": {"version": "1.0.0"},
+            }
+        )
+        # Undecoded parts serialize straight from the raw list
+        raw_bytes = envelope.to_json_bytes()
+        assert envelope._content is None
+        # Decoded parts serialize the same way
+        assert envelope.content[0].text == "Hi"
+        assert envelope.to_json_bytes() == raw_bytes
+        assert json.loads(raw_bytes) == envelope.to_dict()
+
+        input_data = PromptInput(content=[TextContent(text="Hi")], meta={"a": 1})
+        assert json.loads(input_data.to_json_bytes()) == input_data.to_dict()
+
+    def test_content_part_from_dict_unknown_type(self):
+        """Test that an unknown content part type is rejected."""
+        with pytest.raises(ValueError, match="Unknown content part type: audio"):
+            content_part_from_dict({"type": "audio", "data": "..."})
+
+    def test_content_parts_are_slotted(self):
+        """Test content parts use __slots__ instead of a per-instance __dict__."""
+        url = ImageUrl(url="https://example.com/img.png")
+        for part in (TextContent(text="Hello"), url, ImageContent(image_url=url)):
+            assert not hasattr(part, "__dict__")
+
+    def test_response_records_are_slotted(self):
+        """Test records built from API responses carry no __dict__."""
+        usage = StorageUsage.from_dict({"bytesUsed": 10, "assetCount": 1})
+        assert not hasattr(usage, "__dict__")
+        assert usage == StorageUsage(bytes_used=10, asset_count=1)
+
+    def test_prompt_envelope_from_dict_defers_content_parsing(self):
+        """Test multi-modal parts are decoded only when content is read."""
+        raw_content = [
+            {"type": "text", "text": "Hello"},
+            {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}},
+        ]
+        envelope = PromptEnvelope.from_dict(
+            {"id": "test/prompt", "content": raw_content, "meta": {}}
+        )
+
+        assert envelope._content is None  # parts were not decoded
+        assert envelope.to_dict()["content"] == raw_content
+
+        # to_dict() hands out a copy, not the envelope's own parts
+        envelope.to_dict()["content"].append({"type": "text", "text": "extra"})
+        assert len(envelope.content) == 2
+        assert envelope.content[0].text == "Hello"
+        assert envelope.content[1].image_url.url == "https://example.com/a.png"
+        assert envelope.to_dict()["content"] == raw_content
+
+    def test_prompt_envelope_from_dict_rejects_missing_content(self):
+        """Test a null content field fails instead of becoming empty content."""
+        with pytest.raises(ValueError, match="Invalid prompt content"):
+            PromptEnvelope.from_dict({"id": "test/prompt", "content": None})
+
     def test_prompt_envelope_multi_modal_to_dict(self):
         """Test PromptEnvelope with multi-modal content to_dict."""
         envelope = PromptEnvelope(
@@ -438,3 +785,101 @@ class TestContentTypes:
             ],
             "meta": {"version": "1.0.0"},
         }
+
+
+# =============================================================================
+# Async Client Tests
+# =============================================================================
+
+
+class TestAsyncClient:
+    """Tests for the httpx-based async client."""
+
+    @patch("plp_client.async_client.httpx.AsyncClient.request", new_callable=AsyncMock)
+    def test_get_prompt(self, mock_request):
+        """Test getting a prompt asynchronously."""
+        mock_request.return_value = FakeResponse(
+            {
+                "id": "test/prompt",
+                "content": "Hello {{name}}",
+                "meta": {"version": "1.0.0"},
+            }
+        )
+
+        async def run():
+            async with AsyncPLPClient("https://prompts.example.com") as client:
+                return await client.get("test/prompt", "1.0.0")
+
+        prompt = asyncio.run(run())
+
+        assert prompt.id == "test/prompt"
+        assert prompt.content == "Hello {{name}}"
+        call_args = mock_request.call_args
+        assert "/v1/prompts/test/prompt/1.0.0" in call_args[1]["url"]
+
+    @patch("plp_client.async_client.httpx.AsyncClient.request", new_callable=AsyncMock)
+    def test_get_many(self, mock_request):
+        """Test fetching several prompts concurrently preserves order."""
+
+        async def respond(method, url, **kwargs):
+            prompt_id = url.split("/v1/prompts/", 1)[1]
+            return FakeResponse({"id": prompt_id, "content": "", "meta": {}})
+
+        mock_request.side_effect = respond
+
+        async def run():
+            async with AsyncPLPClient("https://prompts.example.com") as client:
+                return await client.get_many(["a/one", "b/two", "c/three", "b/two"])
+
+        prompts = asyncio.run(run())
+
+        assert [p.id for p in prompts] == ["a/one", "b/two", "c/three", "b/two"]
+        assert mock_request.call_count == 3
+
+    @patch("plp_client.async_client.httpx.AsyncClient.request", new_callable=AsyncMock)
+    def test_error_handling_404(self, mock_request):
+        """Test async error handling for 404."""
+        mock_request.return_value = FakeResponse(
+            {"error": "Prompt not found"},
+            status_code=404,
+            headers={"Content-Type": "application/json"},
+        )
+
+        async def run():
+            async with AsyncPLPClient("https://prompts.example.com") as client:
+                await client.get("missing/prompt")
+
+        with pytest.raises(PLPError) as exc_info:
+            asyncio.run(run())
+
+        assert "Prompt not found" in str(exc_info.value)
+        assert exc_info.value.status_code == 404
+
+    def test_authentication_header(self):
+        """Test that the bearer token is set on the shared client."""
+
+        async def run():
+            async with AsyncPLPClient(
+                "https://prompts.example.com", api_key="test-key-123"
+            ) as client:
+                return client._client.headers["Authorization"]
+
+        assert asyncio.run(run()) == "Bearer test-key-123"
+
+
+# =============================================================================
+# Package Exports Tests
+# =============================================================================
+
+
+def test_public_exports():
+    """Test that __all__ lists each public name once and every name resolves."""
+    import plp_client
+    from plp_client import client as client_module
+
+    assert len(plp_client.__all__) == len(set(plp_client.__all__))
+    for name in plp_client.__all__:
+        assert hasattr(plp_client, name), name
+    # Multi-modal types are the single definitions shared with the client module
+    for name in ("TextContent", "ImageUrl", "ImageContent", "PromptEnvelope"):
+        assert getattr(plp_client, name) is getattr(client_module, name)